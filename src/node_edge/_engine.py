@@ -1,15 +1,20 @@
 import json
+import os
 import socket
+from contextlib import contextmanager
 from dataclasses import dataclass
-from enum import Enum
+from errno import EAGAIN, EWOULDBLOCK
+from enum import IntEnum
+from functools import cached_property
 from hashlib import sha256
-from itertools import chain
+from itertools import count
 from pathlib import Path
-from queue import Queue
 from selectors import EVENT_READ, DefaultSelector
+from shutil import copyfile
+from struct import Struct
 from subprocess import DEVNULL, PIPE, Popen
-from tempfile import gettempdir
-from threading import Event, Thread
+from tempfile import gettempdir, mkdtemp
+from threading import Event, RLock, Thread
 from typing import (
     Any,
     Iterator,
@@ -23,10 +28,64 @@ from typing import (
     TypeVar,
     Union,
 )
+from weakref import WeakValueDictionary
 
 from ._utils import xdg_state_home
 from .exceptions import *
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+
+    def _dumps(data) -> bytes:
+        """
+        Wire-level serializer. orjson is noticeably faster than the stdlib
+        and returns bytes directly. OPT_NON_STR_KEYS mimics the stdlib's
+        stringification of non-string mapping keys.
+        """
+
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def _loads(data: bytes):
+        """
+        Wire-level deserializer (bytes in, no intermediate str).
+        """
+
+        return orjson.loads(data)
+
+else:
+
+    def _dumps(data) -> bytes:
+        """
+        Wire-level serializer, stdlib flavor (used when orjson is not
+        installed).
+        """
+
+        return json.dumps(data, ensure_ascii=True).encode("ascii")
+
+    def _loads(data: bytes):
+        """
+        Wire-level deserializer, stdlib flavor.
+        """
+
+        return json.loads(data.decode("utf-8"))
+
+
+#: Not available on Windows, in which case we simply don't try to drain more
+#: than one chunk per select() round.
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+
+#: Frames on the wire are a 4-byte little-endian payload length followed by
+#: the JSON payload itself.
+_FRAME_HEADER = Struct("<I")
+
+#: Source of the runtime that gets copied into every env dir, resolved once
+#: at import time.
+_RUNTIME_JS = Path(__file__).resolve().parent / "runtime.js"
+
 __all__ = [
     "NodeEngine",
     "JavaScriptPointer",
@@ -39,47 +98,34 @@ __all__ = [
 ]
 
 
-@dataclass
-class RemoteMessage:
-    """
-    A JSON message from the JS side
-    """
-
-    content: Any
-
-
-@dataclass
-class LocalMessage:
-    """
-    A JSON message to the JS side
-    """
-
-    content: Any
-
-
-@dataclass
-class ProtocolError:
+@dataclass(slots=True)
+class Eval:
     """
-    A protocol error
+    An eval request + response/exception
     """
 
-    message: str
+    code: str
+    event: Event
+    success: Optional[bool] = None
+    result: Optional[Any] = None
+    error: Optional[Mapping] = None
 
 
-@dataclass
-class Eval:
+@dataclass(slots=True)
+class Expr:
     """
-    An eval request + response/exception
+    An expression-with-bindings request + response/exception
     """
 
     code: str
+    bindings: Mapping
     event: Event
     success: Optional[bool] = None
     result: Optional[Any] = None
     error: Optional[Mapping] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Await:
     """
     An await request + response/exception
@@ -92,7 +138,7 @@ class Await:
     error: Optional[Mapping] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Import:
     """
     An import request + response/exception
@@ -106,25 +152,36 @@ class Import:
     error: Optional[Mapping] = None
 
 
-class CallType(Enum):
+class CallType(IntEnum):
     """
     Because of the conceptual similarity, both calling a function or accessing
     an index are the same message. If the type os func then it'll do
     obj(*args) and otherwise it'll do obj[args[0]].
+
+    Values go over the wire as small integers (mirrored by CallOp in
+    runtime.js), which compare and serialize cheaper than strings.
     """
 
-    func = "func"
-    item = "item"
-    attr = "attr"
-    entry = "entry"
-    prop_count = "prop_count"
-    prop_set = "prop_set"
-    prop_del = "prop_del"
-    prop_list = "prop_list"
-    item_insert = "item_insert"
+    func = 1
+    item = 2
+    attr = 3
+    entry = 4
+    prop_count = 5
+    prop_set = 6
+    prop_del = 7
+    prop_list = 8
+    item_insert = 9
+
+
+#: Call types that don't produce a value the caller needs: inside a batch()
+#: block those can be buffered and shipped together instead of paying one
+#: round-trip each.
+_BATCHED_CALL_TYPES = frozenset(
+    [CallType.prop_set, CallType.prop_del, CallType.item_insert]
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class Call:
     """
     A request to "call" on the pointed object
@@ -137,10 +194,11 @@ class Call:
     success: Optional[bool] = None
     result: Optional[Any] = None
     result_type: Optional[str] = None
+    new_len: Optional[int] = None
     error: Optional[Mapping] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CallOutput:
     """
     Output of a JS "call". We need the "type" field because the "result" might
@@ -153,23 +211,9 @@ class CallOutput:
 
     result: Any
     type: str
-
-
-class Finish:
-    """
-    A finish request, that closes the engine
-    """
-
-
-@dataclass
-class ReleasePointer:
-    """
-    Tells the JS side to delete references to this pointer, which will
-    eventually lead to the garbage collector being able to release the
-    associated memory.
-    """
-
-    id: int
+    #: For array mutations, the length of the array right after the
+    #: operation (None otherwise, or when the reply was batched)
+    new_len: Optional[int] = None
 
 
 @dataclass
@@ -178,20 +222,42 @@ class JavaScriptPointer:
     A pointer to a JavaScript object
     """
 
+    # Manual __slots__ rather than dataclass(slots=True) because weak
+    # references must keep working (the GC tests rely on them) and the
+    # weakref_slot option only appeared in Python 3.11.
+    __slots__ = ("id", "awaitable", "array", "repr", "engine", "_len", "__weakref__")
+
+    #: Cheap type tag, used for dispatch instead of isinstance chains
+    _NE_KIND = "pointer"
+
     id: int
     awaitable: bool
     array: bool
     repr: str
     engine: "NodeEngine"
 
+    def __post_init__(self):
+        #: Length piggybacked on the latest mutation reply (or cached from
+        #: the latest explicit query). Lives here rather than on the array
+        #: proxy because pointers are interned — several proxies can alias
+        #: the same array and they must all see the same length. None means
+        #: we have to ask. Mutations made from the JS side directly won't
+        #: be seen here.
+        self._len: Optional[int] = None
+
     # noinspection PyProtectedMember
     def __del__(self):
         """
         On object deletion, notify the JS side so that it can also free its
-        memory.
+        memory. The engine might be stopped (or not even started) by the
+        time the GC gets here, in which case there is nobody left to notify
+        and we don't care.
         """
 
-        self.engine._events.put(ReleasePointer(self.id))
+        try:
+            self.engine._release_pointer(self.id)
+        except Exception:
+            pass
 
     @property
     def proxy(self) -> Union["JavaScriptProxy", "JavaScriptArrayProxy"]:
@@ -229,20 +295,20 @@ class JavaScriptArrayProxy(MutableSequence[T]):
     engine.
     """
 
+    __slots__ = ("__pointer__", "__weakref__")
+
     def __init__(self, pointer: JavaScriptPointer) -> None:
-        self.__dict__["__pointer__"] = pointer
+        self.__pointer__ = pointer
 
     def __repr__(self):
-        r = self.__dict__["__pointer__"].repr
+        r = self.__pointer__.repr
         return f"<JavaScriptArrayProxy {r}>"
 
     def insert(self, index: int, value: T) -> None:
-        self.__dict__["__pointer__"].engine.call(
-            self, [index, value], CallType.item_insert
-        )
+        self.__pointer__.engine.call(self, [index, value], CallType.item_insert)
 
     def __getitem__(self, index: int) -> T:
-        item = self.__dict__["__pointer__"].engine.call(self, [index], CallType.item)
+        item = self.__pointer__.engine.call(self, [index], CallType.item)
 
         if item.type == "out_of_bounds":
             raise IndexError(f"Index {index} out of range")
@@ -254,19 +320,33 @@ class JavaScriptArrayProxy(MutableSequence[T]):
         return item.result
 
     def __setitem__(self, index: int, value: T) -> None:
-        self.__dict__["__pointer__"].engine.call(
-            self, [index, value], CallType.prop_set
-        )
+        self.__pointer__.engine.call(self, [index, value], CallType.prop_set)
 
     def __delitem__(self, index: int) -> None:
-        self.__dict__["__pointer__"].engine.call(self, [index], CallType.prop_del)
+        self.__pointer__.engine.call(self, [index], CallType.prop_del)
 
     def __len__(self) -> int:
-        return (
-            self.__dict__["__pointer__"]
-            .engine.call(self, [], CallType.prop_count)
-            .result
-        )
+        pointer = self.__pointer__
+
+        if pointer._len is None:
+            pointer._len = pointer.engine.call(self, [], CallType.prop_count).result
+
+        return pointer._len
+
+    def __iter__(self) -> Iterator[T]:
+        engine = self.__pointer__.engine
+        out = engine.call(self, [], CallType.prop_list)
+
+        if out.type == "element_list":
+            # One descriptor per element, all shipped in a single crossing
+            # (the inherited __iter__ would do one getitem per element, plus
+            # a final out-of-bounds probe to catch the IndexError). Resolved
+            # eagerly so every descriptor is accounted for even if the
+            # generator is dropped halfway.
+            yield from [engine._final_value(item) for item in out.result]
+        else:
+            for i in range(len(self)):
+                yield self[i]
 
 
 class JavaScriptMappingProxy(MutableMapping[K, V]):
@@ -275,21 +355,23 @@ class JavaScriptMappingProxy(MutableMapping[K, V]):
     JS engine.
     """
 
+    __slots__ = ("__pointer__", "__weakref__")
+
     def __init__(self, pointer: JavaScriptPointer) -> None:
-        self.__dict__["__pointer__"] = pointer
+        self.__pointer__ = pointer
 
     def __repr__(self):
-        r = self.__dict__["__pointer__"].repr
+        r = self.__pointer__.repr
         return f"<JavaScriptMappingProxy {r}>"
 
     def __setitem__(self, key: K, value: V) -> None:
-        self.__dict__["__pointer__"].engine.call(self, [key, value], CallType.prop_set)
+        self.__pointer__.engine.call(self, [key, value], CallType.prop_set)
 
     def __delitem__(self, key: K) -> None:
-        self.__dict__["__pointer__"].engine.call(self, [key], CallType.prop_del)
+        self.__pointer__.engine.call(self, [key], CallType.prop_del)
 
     def __getitem__(self, key: K) -> V:
-        item = self.__dict__["__pointer__"].engine.call(self, [key], CallType.entry)
+        item = self.__pointer__.engine.call(self, [key], CallType.entry)
 
         if item.type == "no_such_entry":
             raise KeyError(f"No such property {key}")
@@ -299,16 +381,10 @@ class JavaScriptMappingProxy(MutableMapping[K, V]):
         return item.result
 
     def __len__(self) -> int:
-        return (
-            self.__dict__["__pointer__"]
-            .engine.call(self, [], CallType.prop_count)
-            .result
-        )
+        return self.__pointer__.engine.call(self, [], CallType.prop_count).result
 
     def __iter__(self) -> Iterator[K]:
-        yield from self.__dict__["__pointer__"].engine.call(
-            self, [], CallType.prop_list
-        ).result
+        yield from self.__pointer__.engine.call(self, [], CallType.prop_list).result
 
 
 class JavaScriptProxy:
@@ -316,20 +392,43 @@ class JavaScriptProxy:
     Behaves more or less like a JS object. Not really a mapping although
     you can call __getitem__, which is identical to __getattr__. All calls
     are proxied to the JS side, including calls to __call__.
+
+    The pointer lives in a slot rather than the instance dict: access is a
+    C-level load, and there is no per-instance dict to allocate. Writes go
+    through object.__setattr__ because our own __setattr__ proxies to JS.
     """
 
+    __slots__ = ("__pointer__", "__auto_bind__", "__weakref__")
+
+    #: Class attribute, so reading it never reaches __getattr__
+    _NE_KIND = "proxy"
+
     def __init__(
         self, pointer: JavaScriptPointer, auto_bind: Optional[JavaScriptPointer] = None
     ) -> None:
-        self.__dict__["__pointer__"] = pointer
-        self.__dict__["__auto_bind__"] = auto_bind
+        object.__setattr__(self, "__pointer__", pointer)
+        object.__setattr__(self, "__auto_bind__", auto_bind)
 
     def __repr__(self):
-        r = self.__dict__["__pointer__"].repr
+        r = self.__pointer__.repr
         return f"<JavaScriptProxy {r}>"
 
     def __getattr__(self, item):
-        attr = self.__dict__["__pointer__"].engine.call(self, [item], CallType.attr)
+        if item.startswith("__") and item.endswith("__"):
+            # Python pokes at dunders (pickle, copy, ...) speculatively;
+            # never pay a round-trip for those.
+            raise AttributeError(item)
+
+        return self._attr_value(item)
+
+    def _attr_value(self, item):
+        """
+        Fetches an attribute from the remote object. Shared between
+        __getattr__ and the per-shape property descriptors built by
+        NodeEngine.specialize().
+        """
+
+        attr = self.__pointer__.engine.call(self, [item], CallType.attr)
 
         if attr.type == "no_attributes":
             raise TypeError("No attributes on this type")
@@ -341,29 +440,37 @@ class JavaScriptProxy:
         out = attr.result
 
         if isinstance(out, JavaScriptProxy):
-            out.__dict__["__auto_bind__"] = self.__dict__["__pointer__"]
+            object.__setattr__(out, "__auto_bind__", self.__pointer__)
 
         return out
 
     def __getitem__(self, item):
-        return JavaScriptMappingProxy(self.__dict__["__pointer__"]).__getitem__(item)
+        return JavaScriptMappingProxy(self.__pointer__).__getitem__(item)
 
     def __setattr__(self, key, value):
-        self.__dict__["__pointer__"].engine.call(self, [key, value], CallType.prop_set)
+        self.__pointer__.engine.call(self, [key, value], CallType.prop_set)
 
     def __delattr__(self, item):
-        self.__dict__["__pointer__"].engine.call(self, [item], CallType.prop_del)
+        self.__pointer__.engine.call(self, [item], CallType.prop_del)
 
     def __call__(self, *args, **kwargs):
-        return (
-            self.__dict__["__pointer__"]
-            .engine.call(
-                self,
-                dict(args=args, auto_bind=self.__dict__["__auto_bind__"]),
-                CallType.func,
-            )
-            .result
-        )
+        # Hot path: read the pointer once and hand it to the engine
+        # directly, skipping the _get_pointer() type walk, and build the
+        # payload with a literal (no dict() call).
+        pointer = self.__pointer__
+
+        return pointer.engine.call(
+            pointer,
+            {"args": args, "auto_bind": self.__auto_bind__},
+            CallType.func,
+        ).result
+
+
+#: What as_mapping() does for each supported _NE_KIND tag
+_AS_MAPPING_DISPATCH = {
+    "pointer": lambda obj: JavaScriptMappingProxy(obj),
+    "proxy": lambda obj: JavaScriptMappingProxy(obj.__pointer__),
+}
 
 
 def as_mapping(
@@ -372,14 +479,15 @@ def as_mapping(
     """
     Converts the pointer (or another proxy) into a mapping proxy, in case you
     want a full dictionary interface in your JS object.
+
+    Dispatch goes through the _NE_KIND class tags rather than an isinstance
+    chain: one dict lookup instead of walking the candidate types.
     """
 
-    if isinstance(obj, JavaScriptPointer):
-        return JavaScriptMappingProxy(obj)
-    elif isinstance(obj, JavaScriptProxy):
-        return JavaScriptMappingProxy(obj.__dict__["__pointer__"])
-    else:
-        raise NodeEdgeTypeError("Object must be a JavaScriptPointer or JavaScriptProxy")
+    if wrap := _AS_MAPPING_DISPATCH.get(getattr(obj, "_NE_KIND", None)):
+        return wrap(obj)
+
+    raise NodeEdgeTypeError("Object must be a JavaScriptPointer or JavaScriptProxy")
 
 
 PointerIsh = Union[
@@ -390,6 +498,18 @@ PointerIsh = Union[
 ]
 
 
+def _shape_getter(key: str):
+    """
+    Builds the property getter for one key of a specialized proxy class (a
+    factory, so that each property captures its own key).
+    """
+
+    def fget(self):
+        return self._attr_value(key)
+
+    return fget
+
+
 def _get_pointer(pointer: PointerIsh) -> JavaScriptPointer:
     """
     Get the pointer from a proxy
@@ -400,7 +520,7 @@ def _get_pointer(pointer: PointerIsh) -> JavaScriptPointer:
     elif isinstance(
         pointer, (JavaScriptArrayProxy, JavaScriptProxy, JavaScriptMappingProxy)
     ):
-        return pointer.__dict__["__pointer__"]
+        return pointer.__pointer__
     else:
         raise NodeEdgeTypeError(
             "pointer must be a JavaScriptPointer or JavaScriptProxy"
@@ -417,7 +537,7 @@ def _deep_point(obj):
     if isinstance(obj, JavaScriptPointer):
         return dict(type="pointer", id=obj.id)
     elif isinstance(obj, (JavaScriptArrayProxy, JavaScriptProxy)):
-        return dict(type="pointer", id=obj.__dict__["__pointer__"].id)
+        return dict(type="pointer", id=obj.__pointer__.id)
     elif isinstance(obj, (str, bytes, bytearray, int, float, bool)):
         return dict(type="flat", data=obj)
     elif isinstance(obj, Sequence):
@@ -435,6 +555,14 @@ class NodeEngine:
     Manages the Node process, and the communication with it. It allows to
     run JS code from Python, including installing dependencies, creating
     the environment, etc.
+
+    Notes
+    -----
+    There is deliberately no queue between the threads: outbound messages
+    are written to the socket from whichever thread made the call, and the
+    single reader thread resolves replies in place. This means no bounded
+    buffer that could block the reader under burst load, and no
+    producer/consumer synchronization on the per-message path.
     """
 
     def __init__(
@@ -460,25 +588,51 @@ class NodeEngine:
             else [Path(i) for i in env_dir_candidates]
         )
         self._env_dir = None
+        self._socket_path: Optional[Path] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
         self._listen_socket: Optional[socket.socket] = None
         self._remote_conn: Optional[socket.socket] = None
         self._remote_read: Optional[TextIO] = None
         self._remote_proc: Optional[Popen] = None
-        self._events = Queue(1000)
         self._remote_thread: Optional[Thread] = None
-        self._events_thread: Optional[Thread] = None
+        self._connected = Event()
+        self._send_lock = RLock()
+        self._next_id = count(1)
         self._pending = {}
+        self._batch: Optional[List] = None
+        self._interned = WeakValueDictionary()
+        self._handles_seen = {}
+        self._shape_classes = {}
+        self._remote_handlers = {
+            "eval_result": self._on_remote_result,
+            "eval_error": self._on_remote_error,
+            "expr_result": self._on_remote_result,
+            "expr_error": self._on_remote_error,
+            "await_result": self._on_remote_result,
+            "await_error": self._on_remote_error,
+            "import_result": self._on_remote_result,
+            "import_error": self._on_remote_error,
+            "call_result": self._on_call_result,
+            "call_error": self._on_remote_error,
+        }
 
-    @property
+    @cached_property
     def package_signature(self) -> str:
         """
         We create a signature for the package, so that we can reuse the
-        environment if the package is the same (but create new one otherwise)
+        environment if the package is the same (but create new one otherwise).
+        The package is immutable for the lifetime of the engine, so the
+        signature is computed once; the JSON is streamed into the hash chunk
+        by chunk rather than materialized as one big string.
         """
 
-        return sha256(
-            json.dumps(self.package, ensure_ascii=True).encode("ascii")
-        ).hexdigest()
+        h = sha256()
+
+        for chunk in json.JSONEncoder(ensure_ascii=True).iterencode(self.package):
+            h.update(chunk.encode("ascii"))
+
+        return h.hexdigest()
 
     def __enter__(self):
         """
@@ -522,8 +676,10 @@ class NodeEngine:
         idea what to do, so I raise an exception.
         """
 
+        sig = self.package_signature
+
         for candidate in self.env_dir_candidates:
-            full_path = candidate / "node_edge" / "envs" / self.package_signature
+            full_path = candidate / "node_edge" / "envs" / sig
 
             if self._try_env_candidate(full_path):
                 return full_path
@@ -553,13 +709,13 @@ class NodeEngine:
         """
 
         root = self.ensure_env_dir()
-
-        if not (root / "index.js").exists():
-            self._write_package_json(root)
-            self._npm_install(root)
-
+        self._write_package_json(root)
+        npm = self._spawn_npm_install(root)
         self._write_runtime(root)
 
+        if npm is not None:
+            self._wait_npm_install(npm, root)
+
         return root
 
     def _write_package_json(self, root: Path):
@@ -573,13 +729,29 @@ class NodeEngine:
         We're using the scripts section to make sure that we're using the same
         Node binary as NPM is.
 
+        The JSON is encoded in one go and written with a single write: the
+        indentation was purely cosmetic (npm couldn't care less) and
+        json.dump() on a file object produces a flurry of tiny writes.
+
         Parameters
         ----------
         root
             The environment directory
         """
 
-        package = {
+        (root / "package.json").write_bytes(
+            json.dumps(
+                self._full_package(), ensure_ascii=True, separators=(",", ":")
+            ).encode("ascii")
+        )
+
+    def _full_package(self) -> Mapping:
+        """
+        The package.json content that we actually write: what the user
+        specified, plus our own import-type and scripts adjustments.
+        """
+
+        return {
             **self.package,
             "type": "module",
             "scripts": {
@@ -588,14 +760,24 @@ class NodeEngine:
             },
         }
 
-        with open(root / "package.json", "w") as f:
-            json.dump(package, f, indent=4)
+    def _install_token(self) -> str:
+        """
+        A signature of the full package.json content (including our injected
+        keys, so that envs built by older versions of the injection re-install
+        correctly). It is stored in the env dir after a successful NPM install
+        and lets us skip the install entirely when nothing changed.
+        """
+
+        return sha256(
+            json.dumps(self._full_package(), ensure_ascii=True).encode("ascii")
+        ).hexdigest()
 
     def _write_runtime(self, root: Path):
         """
         Writes the runtime file in the environment directory. This is the file
         that will be executed by Node, and that will communicate with the
-        Python side.
+        Python side. copyfile() lets the OS do the copy (sendfile() on Linux)
+        instead of bouncing the bytes through Python buffers.
 
         Parameters
         ----------
@@ -603,17 +785,16 @@ class NodeEngine:
             The environment directory
         """
 
-        with open(root / "index.js", "w", encoding="utf-8") as o, open(
-            Path(__file__).parent / "runtime.js", "r", encoding="utf-8"
-        ) as i:
-            while buf := i.read(1024**2):
-                o.write(buf)
-
+        copyfile(_RUNTIME_JS, root / "index.js")
         (root / "index.js").chmod(0o755)
 
-    def _npm_install(self, root: Path):
+    def _spawn_npm_install(self, root: Path) -> Optional[Popen]:
         """
-        Runs NPM install in the environment directory.
+        Starts NPM install in the environment directory without waiting for
+        it, so that create_env() can do other work (like writing the runtime)
+        while NPM is running. If the env dir holds the token of a previous
+        successful install of the exact same package.json and node_modules is
+        still around, there is nothing to install and None is returned.
 
         Parameters
         ----------
@@ -621,14 +802,38 @@ class NodeEngine:
             The environment directory
         """
 
-        p = Popen(
+        if (root / "node_modules").exists():
+            try:
+                installed = (root / ".node_edge_install_ok").read_text()
+            except OSError:
+                pass
+            else:
+                if installed == self._install_token():
+                    return None
+
+        return Popen(
             args=[self.npm_bin, "install"],
             stdin=DEVNULL,
             stdout=DEVNULL,
             stderr=PIPE,
             cwd=root,
+            start_new_session=True,
         )
 
+    def _wait_npm_install(self, p: Popen, root: Path):
+        """
+        Waits for the NPM install started by _spawn_npm_install() to finish,
+        raising if it failed. On success the install token is written, which
+        is what allows future create_env() calls to skip the install.
+
+        Parameters
+        ----------
+        p
+            The NPM process
+        root
+            The environment directory
+        """
+
         if p.wait():
             try:
                 err = p.stderr.read().decode()[-1000:]
@@ -637,196 +842,154 @@ class NodeEngine:
 
             raise NodeEdgeException(f"Could not create env: {err}")
 
-    def _run_events(self):
-        """
-        Runs the events loop, which is responsible for reading the events
-        from the queue (fed both from remote process and from the local
-        process) and dispatching them to the appropriate callbacks.
-        """
-
-        while evt := self._events.get():
-            match evt:
-                case Finish():
-                    break
-                case LocalMessage(content=data):
-                    self._send_message(data)
-                case Eval(code=code):
-                    self._pending[str(id(evt))] = evt
-                    self._eval(event_id=id(evt), code=code)
-                case RemoteMessage(
-                    content={
-                        "type": "eval_result",
-                        "payload": payload,
-                        "event_id": event_id,
-                    }
-                ):
-                    if event_id in self._pending:
-                        pending_event = self._pending.pop(event_id)
-                        pending_event.success = True
-                        pending_event.result = payload["result"]
-                        pending_event.event.set()
-                case RemoteMessage(
-                    content={
-                        "type": "eval_error",
-                        "payload": payload,
-                        "event_id": event_id,
-                    }
-                ):
-                    if event_id in self._pending:
-                        pending_event = self._pending.pop(event_id)
-                        pending_event.success = False
-                        pending_event.error = payload["error"]
-                        pending_event.event.set()
-                case Await(pointer_id=pointer_id):
-                    self._pending[str(id(evt))] = evt
-                    self._await(event_id=id(evt), pointer_id=pointer_id)
-                case RemoteMessage(
-                    content={
-                        "type": "await_result",
-                        "payload": payload,
-                        "event_id": event_id,
-                    }
-                ):
-                    if event_id in self._pending:
-                        pending_event = self._pending.pop(event_id)
-                        pending_event.success = True
-                        pending_event.result = payload["result"]
-                        pending_event.event.set()
-                case RemoteMessage(
-                    content={
-                        "type": "await_error",
-                        "payload": payload,
-                        "event_id": event_id,
-                    }
-                ):
-                    if event_id in self._pending:
-                        pending_event = self._pending.pop(event_id)
-                        pending_event.success = False
-                        pending_event.error = payload["error"]
-                        pending_event.event.set()
-                case Import(module=module, name=name):
-                    self._pending[str(id(evt))] = evt
-                    self._import(event_id=id(evt), module=module, name=name)
-                case RemoteMessage(
-                    content={
-                        "type": "import_result",
-                        "payload": payload,
-                        "event_id": event_id,
-                    }
-                ):
-                    if event_id in self._pending:
-                        pending_event = self._pending.pop(event_id)
-                        pending_event.success = True
-                        pending_event.result = payload["result"]
-                        pending_event.event.set()
-                case RemoteMessage(
-                    content={
-                        "type": "import_error",
-                        "payload": payload,
-                        "event_id": event_id,
-                    }
-                ):
-                    if event_id in self._pending:
-                        pending_event = self._pending.pop(event_id)
-                        pending_event.success = False
-                        pending_event.error = payload["error"]
-                        pending_event.event.set()
-                case Call(pointer_id=pointer_id, args=args, type=type_):
-                    self._pending[str(id(evt))] = evt
-                    self._call(
-                        pointer_id=pointer_id,
-                        args=args,
-                        call_type=type_,
-                        event_id=id(evt),
-                    )
-                case RemoteMessage(
-                    content={
-                        "type": "call_result",
-                        "payload": payload,
-                        "event_id": event_id,
-                    }
-                ):
-                    if event_id in self._pending:
-                        pending_event = self._pending.pop(event_id)
-                        pending_event.success = True
-                        pending_event.result = payload["result"]
-                        pending_event.result_type = payload["type"]
-                        pending_event.event.set()
-                case RemoteMessage(
-                    content={
-                        "type": "call_error",
-                        "payload": payload,
-                        "event_id": event_id,
-                    }
-                ):
-                    if event_id in self._pending:
-                        pending_event = self._pending.pop(event_id)
-                        pending_event.success = False
-                        pending_event.error = payload["error"]
-                        pending_event.event.set()
-                case ReleasePointer(id=pointer_id):
-                    self._release_pointer(pointer_id=pointer_id)
+        (root / ".node_edge_install_ok").write_text(self._install_token())
+
+    def _on_remote_result(self, content):
+        """
+        Resolves the pending event matching a successful reply from the JS
+        side (eval/await/import).
+        """
+
+        if (pending_event := self._pending.pop(content.get("event_id"), None)) is None:
+            return
+
+        pending_event.success = True
+        pending_event.result = content["payload"]["result"]
+        pending_event.event.set()
+
+    def _on_call_result(self, content):
+        """
+        Same as _on_remote_result() but for call replies, which carry an
+        extra result type.
+        """
+
+        if (pending_event := self._pending.pop(content.get("event_id"), None)) is None:
+            return
+
+        payload = content["payload"]
+        pending_event.success = True
+        pending_event.result = payload["result"]
+        pending_event.result_type = payload["type"]
+        pending_event.new_len = payload.get("new_len")
+        pending_event.event.set()
+
+    def _on_remote_error(self, content):
+        """
+        Resolves the pending event matching an error reply from the JS side.
+        """
+
+        if (pending_event := self._pending.pop(content.get("event_id"), None)) is None:
+            return
+
+        pending_event.success = False
+        pending_event.error = content["payload"]["error"]
+        pending_event.event.set()
 
     def _run_listen_remote(self):
         """
-        Listens to the remote process, and feeds the events queue with the
-        messages it receives. This is done in a separate thread, so that
-        the events loop can run in parallel.
+        Listens to the remote process and dispatches every message it sends
+        straight to the matching handler. This is the only background thread
+        of the engine: replies resolve pending events right here, while
+        outbound messages are written directly from whichever thread asked
+        for them (see _send_message()), so nothing ever crosses a queue.
 
         Notes
         -----
         The logic in there is a bit convoluted because the underlying socket
-        APIs are a bit shitty. The idea is that messages are JSON separated by
-        newlines, and that we need to read the socket until we have a full
-        message, and then we can parse it and feed the queue.
+        APIs are a bit shitty. The idea is that messages are length-prefixed
+        JSON frames, and that we need to read the socket until we have a full
+        frame, and then we can parse it and dispatch it.
 
         We also deal with the fact that the remote process might die, in which
-        case we need to stop the events loop.
+        case we need to stop the loop.
 
         And finally, the local process might ask us to stop, in which case we
         just exit the loop and let the thread die.
 
-        We're using a selector in order to be able to poll every second the
-        "liveness" of the engine (as opposed to using a blocking read, which
-        deals with timeouts in a weird way).
+        We're using a selector that blocks until either the socket has data
+        or stop() pokes the wake-up pipe, so the loop sleeps for real when
+        idle and still reacts immediately to both data and shutdown.
         """
 
-        def handle_line(b_line: bytes):
+        # Everything the loop body touches repeatedly is bound to a local:
+        # LOAD_FAST instead of chained attribute lookups, on every single
+        # message.
+        get_handler = self._remote_handlers.get
+        header_size = _FRAME_HEADER.size
+        unpack_header = _FRAME_HEADER.unpack_from
+
+        def handle_frame(b_frame: bytes):
             try:
-                self._events.put(RemoteMessage(json.loads(b_line.decode("utf-8"))))
+                content = _loads(b_frame)
             except (ValueError, UnicodeError):
-                self._events.put(ProtocolError("Could not decode Node output"))
+                # Garbage on the wire; there is no event to route it to, so
+                # all we can do is drop it.
+                return
+
+            if isinstance(content, dict) and (
+                handler := get_handler(content.get("type"))
+            ):
+                handler(content)
 
         self._remote_conn, _ = self._listen_socket.accept()
-        self._remote_conn.setblocking(False)
+        self._tune_socket(self._remote_conn)
 
-        buf = []
+        buf = bytearray()
+        recv_size = 1024**2
+        recv = self._remote_conn.recv
+        wake_fd = self._wake_r
         sel = DefaultSelector()
         sel.register(self._remote_conn, EVENT_READ)
+        sel.register(self._wake_r, EVENT_READ)
+        select = sel.select
 
-        self._events_thread.start()
+        self._connected.set()
 
         try:
             while True:
-                sel.select(1)
+                for key, _ in select():
+                    if key.fd == wake_fd:
+                        return
 
-                try:
-                    while chunk := self._remote_conn.recv(1024**2):
-                        bits = chunk.split(b"\n")
+                # The selector said the socket is readable, so this blocking
+                # recv() cannot block. In the common case (one small message)
+                # this is the only read before going back to select(), with
+                # no exception raised anywhere.
+                chunk = recv(recv_size)
 
-                        if len(bits) == 1:
-                            buf.append(chunk)
-                        else:
-                            first_line = b"".join(chain(buf, bits[:1]))
-                            handle_line(first_line)
+                if not chunk:
+                    # The remote process hung up on us, nothing more will
+                    # ever come.
+                    return
 
-                            for line in bits[1:-1]:
-                                handle_line(line)
+                buf.extend(chunk)
 
-                            buf.clear()
-                            buf.append(bits[-1])
-                except BlockingIOError:
-                    pass
+                # Only when a chunk filled the buffer entirely can there be
+                # more data pending; drain it without waiting, and stop on
+                # EAGAIN rather than letting an exception drive the loop.
+                while _MSG_DONTWAIT and len(chunk) == recv_size:
+                    try:
+                        chunk = recv(recv_size, _MSG_DONTWAIT)
+                    except OSError as e:
+                        if e.errno in (EAGAIN, EWOULDBLOCK):
+                            break
+
+                        raise
+
+                    if not chunk:
+                        return
+
+                    buf.extend(chunk)
+
+                while len(buf) >= header_size:
+                    (size,) = unpack_header(buf)
+                    end = header_size + size
+
+                    if len(buf) < end:
+                        break
+
+                    handle_frame(bytes(memoryview(buf)[header_size:end]))
+                    del buf[:end]
         except Exception as e:
             match (e):
                 case OSError(errno=9):
@@ -834,6 +997,26 @@ class NodeEngine:
                 case _:
                     raise
 
+    def _tune_socket(self, conn: socket.socket):
+        """
+        Our traffic is request/reply over mostly tiny JSON frames, so on the
+        TCP fallback we disable Nagle's algorithm (which would otherwise
+        happily sit on a small frame for a while waiting for more data). In
+        all cases we ask for comfortable kernel buffers so that large
+        payloads don't force extra round-trips through the event loop.
+
+        Parameters
+        ----------
+        conn
+            The accepted connection to the remote process
+        """
+
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1024**2)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024**2)
+
+        if conn.family != getattr(socket, "AF_UNIX", None):
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     def send_message(self, data):
         """
         Sends a message to the remote process.
@@ -844,13 +1027,15 @@ class NodeEngine:
             The data to send
         """
 
-        self._events.put(LocalMessage(data))
+        self._send_message(data)
 
     def _send_message(self, data):
         """
-        Underlying implementation of the send_message() method, which will run
-        in the events loop's thread (making sure that the socket is connected
-        for example).
+        Serializes a message and writes it to the socket from the calling
+        thread. This blocks until the remote process has connected back, and
+        frames are written one at a time under a lock so that concurrent
+        senders cannot interleave bytes. The lock is reentrant because a
+        GC-triggered pointer release can fire in the middle of a send.
 
         Parameters
         ----------
@@ -858,24 +1043,62 @@ class NodeEngine:
             The data to send
         """
 
-        self._remote_conn.send(
-            json.dumps(data, ensure_ascii=True).encode("ascii") + b"\n"
-        )
+        frame = self._encode_frame(data)
+        self._connected.wait()
+
+        with self._send_lock:
+            self._remote_conn.sendall(frame)
+
+    def _encode_frame(self, data) -> bytes:
+        """
+        Serializes a message into its on-the-wire form, without sending it.
+        Kept separate from _send_message() so that batching can concatenate
+        several frames into a single write.
+        """
+
+        payload = _dumps(data)
+
+        return _FRAME_HEADER.pack(len(payload)) + payload
+
+    def _create_listen_socket(self) -> str:
+        """
+        Creates the socket that the remote process will connect back to, and
+        returns the address to pass to it. We favor a Unix socket because it
+        skips the whole TCP/IP stack for what is purely local traffic, which
+        lowers the latency of every single message. The socket lives in its
+        own temp directory (and not in the env dir) because Unix socket paths
+        are limited to ~100 bytes, which the env dir can easily exceed.
+
+        On platforms without Unix sockets (Windows), we fall back to a TCP
+        socket on the loopback interface and pass the port instead.
+        """
+
+        if hasattr(socket, "AF_UNIX"):
+            self._socket_path = Path(mkdtemp(prefix="node_edge-")) / "ne.sock"
+            self._listen_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._listen_socket.bind(f"{self._socket_path}")
+            self._listen_socket.listen(1)
+
+            return f"{self._socket_path}"
+        else:
+            self._listen_socket = socket.create_server(
+                address=("127.0.0.1", 0),
+                family=socket.AF_INET,
+            )
+            _, port, *_ = self._listen_socket.getsockname()
+
+            return f"{port}"
 
     def start(self):
         """
-        Starts the engine. This will start the remote process, and the events
-        loop. The remote process will connect back through the socket and
-        when that happens we'll start the events loop.
+        Starts the engine. This will start the remote process and the reader
+        thread; once the remote process connects back through the socket,
+        calls become possible (they block until that happens).
         """
 
         root = self.create_env()
-
-        self._listen_socket = socket.create_server(
-            address=("127.0.0.1", 0),
-            family=socket.AF_INET,
-        )
-        _, port, *_ = self._listen_socket.getsockname()
+        address = self._create_listen_socket()
+        self._wake_r, self._wake_w = os.pipe()
 
         extra = {}
 
@@ -887,34 +1110,59 @@ class NodeEngine:
             )
 
         self._remote_proc = Popen(
-            args=[self.node_bin, "./index.js", f"{port}"],
+            args=[self.node_bin, "./index.js", address],
             cwd=root,
             **extra,
         )
 
         self._remote_thread = Thread(target=self._run_listen_remote)
-        self._events_thread = Thread(target=self._run_events)
-
         self._remote_thread.start()
 
     def stop(self):
         """
-        Stops the engine. This will stop the events loop and disconnect the
+        Stops the engine. This will stop the reader thread and disconnect the
         socket. The remote process will then exit on its own due to the
         disconnection.
+
+        The reader thread is woken up through the self-pipe (it blocks on
+        select() without timeout otherwise) and joined before the pipe is
+        closed, so that it never sees a dead fd.
         """
 
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"\x00")
+            except OSError:
+                pass
+
         if self._remote_conn:
             self._remote_conn.close()
 
         if self._listen_socket:
             self._listen_socket.close()
 
-        self._events.put(Finish())
+        if self._socket_path:
+            try:
+                self._socket_path.unlink(missing_ok=True)
+                self._socket_path.parent.rmdir()
+            except OSError:
+                pass
+
+        if self._remote_thread is not None:
+            self._remote_thread.join(timeout=5)
+
+        if self._wake_w is not None:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
 
     def _release_pointer(self, pointer_id: int):
         """
-        Releases a pointer on the remote process.
+        Releases a pointer on the remote process. The message carries how
+        many descriptors we received for that id, so that the JS side only
+        frees the object once nothing is left in flight (a descriptor could
+        be crossing the wire while the GC collects our last pointer for the
+        same id).
 
         Parameters
         ----------
@@ -922,14 +1170,17 @@ class NodeEngine:
             The ID of the pointer to release
         """
 
-        self._send_message(
-            {
-                "type": "release_pointer",
-                "payload": {
-                    "pointer_id": pointer_id,
-                },
-            }
-        )
+        with self._send_lock:
+            count = self._handles_seen.pop(pointer_id, 0)
+            self._send_message(
+                {
+                    "type": "release_pointer",
+                    "payload": {
+                        "pointer_id": pointer_id,
+                        "count": count,
+                    },
+                }
+            )
 
     def _final_value(self, msg):
         """
@@ -941,13 +1192,30 @@ class NodeEngine:
         """
 
         if msg["type"] == "pointer":
-            return JavaScriptPointer(
-                id=msg["id"],
-                awaitable=msg["awaitable"],
-                repr=msg["repr"],
-                array=msg["array"],
-                engine=self,
-            ).proxy
+            # The JS side hands out stable ids, so the same remote object can
+            # come back several times. Interning the pointer keeps a single
+            # owner per id — otherwise the first one to be GC'd would release
+            # the JS object from under its siblings. The lock (reentrant, the
+            # same one the GC-triggered release takes) keeps the seen-count
+            # consistent with the release that reports it.
+            pointer_id = msg["id"]
+
+            with self._send_lock:
+                self._handles_seen[pointer_id] = (
+                    self._handles_seen.get(pointer_id, 0) + 1
+                )
+
+                if (pointer := self._interned.get(pointer_id)) is None:
+                    pointer = JavaScriptPointer(
+                        id=pointer_id,
+                        awaitable=msg["awaitable"],
+                        repr=msg["repr"],
+                        array=msg["array"],
+                        engine=self,
+                    )
+                    self._interned[pointer_id] = pointer
+
+            return pointer.proxy
         elif msg["type"] == "naive":
             return msg["data"]
 
@@ -964,8 +1232,21 @@ class NodeEngine:
             The JS code to evaluate
         """
 
+        if self._batch:
+            self._flush_batch()
+
         msg = Eval(code, Event())
-        self._events.put(msg)
+        event_id = next(self._next_id)
+        self._pending[event_id] = msg
+        self._send_message(
+            dict(
+                type="eval",
+                payload=dict(
+                    event_id=event_id,
+                    code=code,
+                ),
+            )
+        )
         msg.event.wait()
 
         if msg.success:
@@ -973,28 +1254,82 @@ class NodeEngine:
         else:
             raise JavaScriptError(**msg.error)
 
-    def _eval(self, event_id: int, code: str) -> None:
+    def expr(self, code: str, **bindings: Any) -> Any:
         """
-        Underlying implementation of the eval() method, which will run in the
-        events loop's thread.
+        Evaluates a single expression in the remote process, with the keyword
+        arguments made visible to the code as $-prefixed variables. This lets
+        you collapse what would be several proxy round-trips into one:
+
+        >>> ne.expr("$obj.baz() + $x", obj=obj, x=1)
+
+        Bindings accept the same values as call arguments (pointers, proxies
+        and JSON-serializable structures).
 
         Parameters
         ----------
-        event_id
-            The ID of the event
         code
-            The JS code to evaluate
+            The JS expression to evaluate
+        bindings
+            Values to expose to the expression
         """
 
+        if self._batch:
+            self._flush_batch()
+
+        clean = {name: _deep_point(value) for name, value in bindings.items()}
+        msg = Expr(code, clean, Event())
+        event_id = next(self._next_id)
+        self._pending[event_id] = msg
         self._send_message(
             dict(
-                type="eval",
+                type="expr",
                 payload=dict(
-                    event_id=f"{event_id}",
+                    event_id=event_id,
                     code=code,
+                    bindings=clean,
                 ),
             )
         )
+        msg.event.wait()
+
+        if msg.success:
+            return self._final_value(msg.result)
+        else:
+            raise JavaScriptError(**msg.error)
+
+    def specialize(self, proxy: JavaScriptProxy) -> JavaScriptProxy:
+        """
+        Returns a proxy to the same object whose class carries one property
+        descriptor per (current) key of the remote object, so that attribute
+        access skips the dynamic __getattr__ path. Classes are cached by key
+        tuple, so objects sharing a shape share a class.
+
+        The specialized class reflects the keys at the time of the call;
+        attributes added later still work through __getattr__.
+
+        Parameters
+        ----------
+        proxy
+            The proxy to specialize
+        """
+
+        if not isinstance(proxy, JavaScriptProxy):
+            raise NodeEdgeTypeError("Can only specialize a JavaScriptProxy")
+
+        pointer = proxy.__pointer__
+        keys = tuple(self.call(pointer, [], CallType.prop_list).result)
+
+        if (cls := self._shape_classes.get(keys)) is None:
+            ns = {"__slots__": ()}
+
+            for key in keys:
+                if key.isidentifier() and not key.startswith("_"):
+                    ns[key] = property(_shape_getter(key))
+
+            cls = type(f"JSShape_{len(self._shape_classes)}", (JavaScriptProxy,), ns)
+            self._shape_classes[keys] = cls
+
+        return cls(pointer, proxy.__auto_bind__)
 
     def await_(self, pointer: PointerIsh) -> Any:
         """
@@ -1008,42 +1343,76 @@ class NodeEngine:
             The pointer to await
         """
 
-        pointer = _get_pointer(pointer)
-
-        if not pointer.awaitable:
-            raise NodeEdgeValueError("Cannot await a non-awaitable pointer")
-
-        msg = Await(pointer.id, Event())
-        self._events.put(msg)
-        msg.event.wait()
+        return self.await_many([pointer])[0]
 
-        if msg.success:
-            return self._final_value(msg.result)
-        else:
-            raise JavaScriptError(**msg.error)
-
-    def _await(self, event_id: int, pointer_id: str) -> None:
+    def await_many(self, pointers: Sequence[PointerIsh]) -> List[Any]:
         """
-        Underlying implementation of the await_() method, which will run in the
-        events loop's thread.
+        Awaits several pointers at once. All the requests leave in a single
+        write and the replies are waited together, so the total latency is
+        that of the slowest promise instead of the sum of all of them.
+
+        Returns the values in the same order as the pointers. If any of them
+        rejected, the first error (in argument order) is raised — after every
+        promise settled.
 
         Parameters
         ----------
-        event_id
-            The ID of the event
-        pointer_id
-            The ID of the pointer to await
+        pointers
+            The pointers to await
         """
 
-        self._send_message(
-            dict(
-                type="await",
-                payload=dict(
-                    event_id=f"{event_id}",
-                    pointer_id=pointer_id,
-                ),
+        if self._batch:
+            self._flush_batch()
+
+        # Validate everything before registering anything: a bad pointer in
+        # the middle of the list must not leave earlier entries dangling in
+        # the pending table.
+        pointers = [_get_pointer(pointer) for pointer in pointers]
+
+        for pointer in pointers:
+            if not pointer.awaitable:
+                raise NodeEdgeValueError("Cannot await a non-awaitable pointer")
+
+        msgs = []
+        frames = []
+
+        for pointer in pointers:
+            msg = Await(pointer.id, Event())
+            event_id = next(self._next_id)
+            self._pending[event_id] = msg
+            msgs.append(msg)
+            frames.append(
+                self._encode_frame(
+                    dict(
+                        type="await",
+                        payload=dict(
+                            event_id=event_id,
+                            pointer_id=pointer.id,
+                        ),
+                    )
+                )
             )
-        )
+
+        self._connected.wait()
+
+        with self._send_lock:
+            self._remote_conn.sendall(b"".join(frames))
+
+        out = []
+        error = None
+
+        for msg in msgs:
+            msg.event.wait()
+
+            if msg.success:
+                out.append(self._final_value(msg.result))
+            elif error is None:
+                error = msg.error
+
+        if error is not None:
+            raise JavaScriptError(**error)
+
+        return out
 
     def import_from(self, module: str, name: str = "default") -> Any:
         """
@@ -1052,31 +1421,28 @@ class NodeEngine:
         etc.
         """
 
-        msg = Import(module, name, Event())
-        self._events.put(msg)
-        msg.event.wait()
-
-        if msg.success:
-            return self._final_value(msg.result)
-        else:
-            raise JavaScriptError(**msg.error)
-
-    def _import(self, event_id: int, module: str, name: str) -> None:
-        """
-        Sending the import message to the other side (running here to be in the
-        right thread)
-        """
+        if self._batch:
+            self._flush_batch()
 
+        msg = Import(module, name, Event())
+        event_id = next(self._next_id)
+        self._pending[event_id] = msg
         self._send_message(
             dict(
                 type="import",
                 payload=dict(
-                    event_id=f"{event_id}",
+                    event_id=event_id,
                     module=module,
                     name=name,
                 ),
             )
         )
+        msg.event.wait()
+
+        if msg.success:
+            return self._final_value(msg.result)
+        else:
+            raise JavaScriptError(**msg.error)
 
     def call(
         self, pointer: PointerIsh, args: Sequence[Any], call_type: CallType
@@ -1097,36 +1463,116 @@ class NodeEngine:
         """
 
         pointer = _get_pointer(pointer)
+        batched = self._batch is not None and call_type in _BATCHED_CALL_TYPES
+
+        if not batched and self._batch:
+            # Flushed before this call registers itself, like eval() and
+            # friends, so that a failing flush cannot leave an entry
+            # dangling in the pending table with its frame never sent
+            self._flush_batch()
 
         clean_args: List[Any] = _deep_point(args)  # noqa
         msg = Call(pointer.id, clean_args, call_type, Event())
-        self._events.put(msg)
+        event_id = next(self._next_id)
+        self._pending[event_id] = msg
+        frame = self._encode_frame(
+            dict(
+                type="call",
+                payload=dict(
+                    event_id=event_id,
+                    pointer_id=pointer.id,
+                    args=clean_args,
+                    call_type=call_type.value,
+                ),
+            )
+        )
+
+        if batched:
+            self._batch.append((msg, frame))
+            # The reply (and its piggybacked length) only lands at flush
+            # time, so until then the cache cannot be trusted
+            pointer._len = None
+
+            return CallOutput(result=None, type="success")
+
+        self._connected.wait()
+
+        with self._send_lock:
+            self._remote_conn.sendall(frame)
+
         msg.event.wait()
 
         if msg.success:
+            if call_type in _BATCHED_CALL_TYPES:
+                # Updated here rather than in the proxies so that every
+                # alias over this pointer sees the new length, no matter
+                # which one issued the mutation
+                pointer._len = msg.new_len
+
             return CallOutput(
                 result=self._final_value(msg.result),
                 type=msg.result_type,
+                new_len=msg.new_len,
             )
         else:
             raise JavaScriptError(**msg.error)
 
-    def _call(
-        self, pointer_id: str, args: List[Any], call_type: CallType, event_id: int
-    ) -> None:
+    @contextmanager
+    def batch(self):
         """
-        Sending the call message to the other side (running here to be in the
-        right thread)
+        Buffers mutating proxy operations (set/delete/insert) so that they
+        all leave in a single write instead of paying one round-trip each.
+        Reads issued inside the block transparently flush what's pending
+        first, so ordering is preserved.
+
+        Inside the block, buffered mutations report success immediately; a
+        failure on the JS side surfaces as a JavaScriptError when the batch
+        is flushed (at the latest when the block exits). The flush happens
+        even if the body raises — those mutations already reported success
+        to their callers, so dropping them is not an option.
         """
 
-        self._send_message(
-            dict(
-                type="call",
-                payload=dict(
-                    event_id=f"{event_id}",
-                    pointer_id=pointer_id,
-                    args=args,
-                    call_type=call_type.value,
-                ),
-            )
-        )
+        if self._batch is not None:
+            # Nested batches just ride along the outer one
+            yield
+
+            return
+
+        self._batch = []
+
+        try:
+            yield
+        finally:
+            try:
+                self._flush_batch()
+            finally:
+                self._batch = None
+
+    def _flush_batch(self):
+        """
+        Sends every buffered mutation as one write, then waits for all the
+        replies. The first error encountered (in sending order) is raised,
+        after all replies came back.
+        """
+
+        ops, self._batch = self._batch, []
+
+        if not ops:
+            return
+
+        frame = b"".join(frame for _, frame in ops)
+        self._connected.wait()
+
+        with self._send_lock:
+            self._remote_conn.sendall(frame)
+
+        error = None
+
+        for msg, _ in ops:
+            msg.event.wait()
+
+            if not msg.success and error is None:
+                error = msg.error
+
+        if error is not None:
+            raise JavaScriptError(**error)
@@ -95,14 +95,44 @@ function mutePromise(promise) {
     Promise.resolve(promise).catch(() => {});
 }
 
+/**
+ * Numeric call opcodes, mirror of Python's CallType.
+ */
+const CallOp = Object.freeze({
+    FUNC: 1,
+    ITEM: 2,
+    ATTR: 3,
+    ENTRY: 4,
+    PROP_COUNT: 5,
+    PROP_SET: 6,
+    PROP_DEL: 7,
+    PROP_LIST: 8,
+    ITEM_INSERT: 9,
+});
+
 /**
  * This executes the JS code coming from Python.
  */
 class Executor {
+    static MAX_CACHED_SCRIPTS = 128;
+
     constructor() {
         this.context = {};
-        this.pointers = {};
+        // Maps keyed by numeric id: plain objects would stringify every
+        // integer key on each access
+        this.pointers = new Map();
         this.nextId = 0;
+        // Stable ids: the same live object always gets the same pointer id,
+        // and its descriptor (repr included) is computed once.
+        this.ids = new WeakMap();
+        this.descriptors = new Map();
+        // How many descriptors were handed out per id. Python counts the
+        // ones it received and sends that count back with the release, so
+        // an object is only freed once no descriptor is left in flight.
+        this.handouts = new Map();
+        // Compiled-script cache: evaluating the same source twice skips
+        // V8's parse/compile. Bounded, in insertion order (see eval()).
+        this.scripts = new Map();
 
         vm.createContext(this.context);
     }
@@ -114,7 +144,48 @@ class Executor {
      * @returns {any}
      */
     eval(code) {
-        return this.toPointer(vm.runInContext(code, this.context));
+        let script = this.scripts.get(code);
+
+        if (script === undefined) {
+            script = new vm.Script(code);
+
+            if (this.scripts.size >= Executor.MAX_CACHED_SCRIPTS) {
+                // Map iterates in insertion order, so the first key is the
+                // least recently used one (a hit re-inserts below).
+                this.scripts.delete(this.scripts.keys().next().value);
+            }
+        } else {
+            this.scripts.delete(code);
+        }
+
+        this.scripts.set(code, script);
+
+        return this.toPointer(script.runInContext(this.context));
+    }
+
+    /**
+     * Evaluates a single expression with Python-provided bindings. Bindings
+     * are exposed to the code as $-prefixed variables for the duration of
+     * the call, so a whole chain like "$obj.baz()" costs one crossing.
+     *
+     * @param {string} code The expression to evaluate
+     * @param {object} bindings Name to deep-pointed value mapping
+     * @returns {any}
+     */
+    expr(code, bindings) {
+        const names = Object.keys(bindings);
+
+        for (const name of names) {
+            this.context["$" + name] = this.deepResolve(bindings[name]);
+        }
+
+        try {
+            return this.toPointer(vm.runInContext(code, this.context));
+        } finally {
+            for (const name of names) {
+                delete this.context["$" + name];
+            }
+        }
     }
 
     /**
@@ -125,7 +196,7 @@ class Executor {
      *          The result of the awaited pointer
      */
     async await(pointerId) {
-        const result = Promise.resolve(this.pointers[pointerId]);
+        const result = Promise.resolve(this.pointers.get(pointerId));
         return this.toPointer(await result);
     }
 
@@ -134,27 +205,51 @@ class Executor {
 
         if (isNaiveObject(obj)) {
             return { type: "naive", data: obj };
-        } else {
-            const id = this.nextId;
-            this.nextId += 1;
-            this.pointers[id] = obj;
-
-            return {
-                type: "pointer",
-                id,
-                awaitable: isAwaitable(obj),
-                array: Array.isArray(obj),
-                repr: repr(obj),
-            };
         }
+
+        // Values like undefined or symbols cannot be WeakMap keys; those
+        // keep getting fresh ids.
+        const weakable =
+            (typeof obj === "object" && obj !== null) ||
+            typeof obj === "function";
+
+        if (weakable) {
+            const known = this.ids.get(obj);
+
+            if (known !== undefined && this.pointers.has(known)) {
+                this.handouts.set(known, this.handouts.get(known) + 1);
+                return this.descriptors.get(known);
+            }
+        }
+
+        const id = this.nextId;
+        this.nextId += 1;
+        this.pointers.set(id, obj);
+
+        const descriptor = {
+            type: "pointer",
+            id,
+            awaitable: isAwaitable(obj),
+            array: Array.isArray(obj),
+            repr: repr(obj),
+        };
+
+        if (weakable) {
+            this.ids.set(obj, id);
+            this.descriptors.set(id, descriptor);
+        }
+
+        this.handouts.set(id, 1);
+
+        return descriptor;
     }
 
     /**
      * Returns the pointer only if it exists, raises an exception otherwise.
      */
     getPointer(pointerId) {
-        if (this.pointers.hasOwnProperty(pointerId)) {
-            return this.pointers[pointerId];
+        if (this.pointers.has(pointerId)) {
+            return this.pointers.get(pointerId);
         }
 
         throw new Error(`Pointer ${pointerId} does not exist`);
@@ -188,9 +283,21 @@ class Executor {
      * side. If the pointer does not exist, do not do anything (could be a case
      * of double call, which can happen in Python).
      */
-    releasePointer(pointerId) {
-        if (this.pointers.hasOwnProperty(pointerId)) {
-            delete this.pointers[pointerId];
+    releasePointer(pointerId, count) {
+        const remaining = (this.handouts.get(pointerId) || 0) - count;
+
+        if (remaining > 0) {
+            // Python hasn't processed every descriptor we handed out for
+            // this id yet: some are still in flight, and whoever receives
+            // them will send its own release later.
+            this.handouts.set(pointerId, remaining);
+            return;
+        }
+
+        if (this.pointers.has(pointerId)) {
+            this.pointers.delete(pointerId);
+            this.descriptors.delete(pointerId);
+            this.handouts.delete(pointerId);
             console.log(`Released pointer ${pointerId}`);
         }
     }
@@ -206,13 +313,17 @@ class Handler {
     }
 
     /**
-     * Sends a message back to the Python side
+     * Sends a message back to the Python side, as a length-prefixed frame
+     * (4-byte little-endian payload size, then the JSON payload).
      *
      * @param {object} obj Any object that can be serialized to JSON
      */
     sendMessage(obj) {
         console.log("Sending message", obj);
-        this.client.write(JSON.stringify(obj) + "\n");
+        const payload = Buffer.from(JSON.stringify(obj), "utf-8");
+        const header = Buffer.allocUnsafe(4);
+        header.writeUInt32LE(payload.length, 0);
+        this.client.write(Buffer.concat([header, payload]));
     }
 
     /**
@@ -257,6 +368,37 @@ class Handler {
         }
     }
 
+    /**
+     * Deals with an expr event: evaluates the expression with its bindings
+     * and sends the result (or the error) back to the Python side.
+     *
+     * @param {string} event_id The event ID
+     * @param {string} code The expression to evaluate
+     * @param {object} bindings Name to deep-pointed value mapping
+     */
+    handleExpr({ event_id, code, bindings }) {
+        let result;
+
+        try {
+            result = this.executor.expr(code, bindings);
+            this.sendMessage({
+                event_id,
+                type: "expr_result",
+                payload: {
+                    result,
+                },
+            });
+        } catch (error) {
+            this.sendMessage({
+                event_id,
+                type: "expr_error",
+                payload: {
+                    error: this.serializeError(error),
+                },
+            });
+        }
+    }
+
     /**
      * Deals with an await event. If the pointer is valid, it will be awaited
      * and result will be sent back to the Python side. If the pointer is not
@@ -334,21 +476,22 @@ class Handler {
     handleCall({ event_id, pointer_id, args, call_type }) {
         let result;
         let type = "success";
+        let new_len = null;
 
         try {
             const pointer = this.executor.getPointer(pointer_id);
             const resolvedArgs = this.executor.deepResolve(args);
 
-            if (call_type === "func") {
+            if (call_type === CallOp.FUNC) {
                 const { args, auto_bind } = resolvedArgs;
                 result = pointer.call(auto_bind, ...args);
-            } else if (call_type === "entry") {
+            } else if (call_type === CallOp.ENTRY) {
                 if (!Object.hasOwnProperty.call(pointer, resolvedArgs[0])) {
                     type = "no_such_entry";
                 } else {
                     result = pointer[resolvedArgs[0]];
                 }
-            } else if (call_type === "attr") {
+            } else if (call_type === CallOp.ATTR) {
                 try {
                     if (!(resolvedArgs[0] in pointer)) {
                         type = "no_such_property";
@@ -363,7 +506,7 @@ class Handler {
                         throw error;
                     }
                 }
-            } else if (call_type === "item") {
+            } else if (call_type === CallOp.ITEM) {
                 if (!Array.isArray(pointer)) {
                     type = "not_an_array";
                 } else {
@@ -375,28 +518,38 @@ class Handler {
                         result = pointer[idx];
                     }
                 }
-            } else if (call_type === "prop_count") {
+            } else if (call_type === CallOp.PROP_COUNT) {
                 if (Array.isArray(pointer)) {
                     result = pointer.length;
                 } else {
                     result = Object.keys(pointer).length;
                 }
-            } else if (call_type === "prop_set") {
+            } else if (call_type === CallOp.PROP_SET) {
                 const [key, value] = resolvedArgs;
                 pointer[key] = value;
-            } else if (call_type === "prop_del") {
+
+                if (Array.isArray(pointer)) {
+                    new_len = pointer.length;
+                }
+            } else if (call_type === CallOp.PROP_DEL) {
                 if (Array.isArray(pointer)) {
                     pointer.splice(resolvedArgs[0], 1);
+                    new_len = pointer.length;
                 } else {
                     delete pointer[resolvedArgs[0]];
                 }
-            } else if (call_type === "prop_list") {
+            } else if (call_type === CallOp.PROP_LIST) {
                 if (Array.isArray(pointer)) {
-                    result = pointer;
+                    // One descriptor per element, so the Python side can
+                    // materialize the whole array in a single crossing
+                    result = pointer.map((item) =>
+                        this.executor.toPointer(item)
+                    );
+                    type = "element_list";
                 } else {
                     result = Object.keys(pointer);
                 }
-            } else if (call_type === "item_insert") {
+            } else if (call_type === CallOp.ITEM_INSERT) {
                 if (!Array.isArray(pointer)) {
                     // noinspection ExceptionCaughtLocallyJS
                     throw new Error("Can only insert into arrays");
@@ -404,6 +557,7 @@ class Handler {
 
                 const [index, value] = resolvedArgs;
                 pointer.splice(index, 0, value);
+                new_len = pointer.length;
             } else {
                 // noinspection ExceptionCaughtLocallyJS
                 throw new Error(`Unknown call type ${call_type}`);
@@ -427,6 +581,9 @@ class Handler {
                     payload: {
                         result: this.executor.toPointer(result),
                         type,
+                        // Piggybacked post-mutation array length, so the
+                        // Python side doesn't come back to ask for it
+                        new_len,
                     },
                 });
             })
@@ -444,8 +601,8 @@ class Handler {
     /**
      * Handles pointer being released
      */
-    handleReleasePointer({ pointer_id }) {
-        this.executor.releasePointer(pointer_id);
+    handleReleasePointer({ pointer_id, count }) {
+        this.executor.releasePointer(pointer_id, count);
     }
 
     /**
@@ -453,11 +610,11 @@ class Handler {
      *
      * @param {string} line A line of JSON
      */
-    handleLine(line) {
+    handleFrame(frame) {
         let event;
 
         try {
-            event = JSON.parse(line);
+            event = JSON.parse(frame.toString("utf-8"));
         } catch (e) {
             throw Error("Invalid JSON");
         }
@@ -474,6 +631,8 @@ class Handler {
 
         if (event.type === "eval") {
             this.handleEval(event.payload);
+        } else if (event.type === "expr") {
+            this.handleExpr(event.payload);
         } else if (event.type === "await") {
             this.handleAwait(event.payload);
         } else if (event.type === "import") {
@@ -489,9 +648,11 @@ class Handler {
 }
 
 /**
- * Parse the command line arguments, which contain the port to connect to.
+ * Parse the command line arguments, which contain the address to connect to.
+ * That's either a Unix socket path or, on platforms without Unix sockets, a
+ * TCP port on the loopback interface (purely numeric argument).
  *
- * @returns {{port: number}}
+ * @returns {{path: string}|{port: number}}
  */
 function parseArgv() {
     const argv = process.argv.slice(2);
@@ -500,14 +661,13 @@ function parseArgv() {
         throw Error("Expected exactly 1 argument");
     }
 
-    const [portStr] = argv;
-    const port = parseInt(portStr, 10);
+    const [address] = argv;
 
-    if (Number.isNaN(port)) {
-        throw Error(`Port ${portStr} is not a number`);
+    if (/^\d+$/.test(address)) {
+        return { port: parseInt(address, 10) };
     }
 
-    return { port };
+    return { path: address };
 }
 
 /**
@@ -516,31 +676,35 @@ function parseArgv() {
 function main() {
     const args = parseArgv();
     const client = new net.Socket();
-    const buf = [];
     const handler = new Handler(client);
+    let buf = Buffer.alloc(0);
 
-    client.setEncoding("utf-8");
-    client.connect({
-        host: "127.0.0.1",
-        port: args.port,
-    });
+    // Tiny request/reply frames: never let Nagle delay them (no-op on a
+    // Unix socket).
+    client.setNoDelay(true);
+
+    if (args.path) {
+        client.connect({ path: args.path });
+    } else {
+        client.connect({
+            host: "127.0.0.1",
+            port: args.port,
+        });
+    }
 
     client.on("data", function (data) {
         try {
-            const lines = data.split("\n");
+            buf = buf.length ? Buffer.concat([buf, data]) : data;
 
-            if (lines.length === 1) {
-                buf.push(data);
-            } else {
-                const firstLine = buf.join("") + lines[0];
-                handler.handleLine(firstLine);
+            while (buf.length >= 4) {
+                const size = buf.readUInt32LE(0);
 
-                for (const line of lines.slice(1, lines.length - 1)) {
-                    handler.handleLine(line);
+                if (buf.length < 4 + size) {
+                    break;
                 }
 
-                buf.length = 0;
-                buf.push(lines[lines.length - 1]);
+                handler.handleFrame(buf.subarray(4, 4 + size));
+                buf = buf.subarray(4 + size);
             }
         } catch (e) {
             client.destroy();
@@ -0,0 +1,27 @@
+from pytest import fixture
+
+from node_edge import NodeEngine
+
+
+@fixture(scope="session")
+def shared_engine():
+    """
+    Starting an engine means provisioning an env and spawning a Node process,
+    which dwarfs the tests themselves. Tests that don't need specific
+    dependencies all share this one engine — which also means they share its
+    VM context, so top-level const/class names must stay unique across tests.
+    """
+
+    with NodeEngine({}) as ne:
+        yield ne
+
+
+@fixture(scope="session")
+def axios_engine():
+    """
+    Same idea as shared_engine, for tests that need axios installed. Keyed
+    by its own package set, so it gets its own env and Node process.
+    """
+
+    with NodeEngine(dict(dependencies=dict(axios="^1.2.0"))) as ne:
+        yield ne
@@ -1,21 +1,44 @@
 from pytest import raises
 
-from node_edge import NodeEngine
 from node_edge.exceptions import *
 
 
-def test_await():
-    with NodeEngine({}) as ne:
-        promise = ne.eval("new Promise((resolve) => resolve(42))")
-        assert ne.await_(promise) == 42
+def test_await(shared_engine):
+    ne = shared_engine
+    promise = ne.eval("new Promise((resolve) => resolve(42))")
+    assert ne.await_(promise) == 42
 
-        promise = ne.eval("new Promise((resolve, reject) => reject(new Error('fail')))")
+    promise = ne.eval("new Promise((resolve, reject) => reject(new Error('fail')))")
 
-        with raises(JavaScriptError):
-            ne.await_(promise)
+    with raises(JavaScriptError):
+        ne.await_(promise)
 
-        ne.eval("function yolo() {}")
-        yolo = ne.eval("yolo")
+    ne.eval("function yolo() {}")
+    yolo = ne.eval("yolo")
 
-        with raises(NodeEdgeValueError):
-            ne.await_(yolo)
+    with raises(NodeEdgeValueError):
+        ne.await_(yolo)
+
+
+def test_await_many(shared_engine):
+    ne = shared_engine
+    promises = [ne.eval(f"new Promise((resolve) => resolve({i}))") for i in range(3)]
+    assert ne.await_many(promises) == [0, 1, 2]
+
+    bad = ne.eval("new Promise((resolve, reject) => reject(new Error('fail')))")
+
+    with raises(JavaScriptError):
+        ne.await_many([promises[0], bad])
+
+
+def test_await_many_invalid(shared_engine):
+    ne = shared_engine
+    promise = ne.eval("new Promise((resolve) => resolve(1))")
+    ne.eval("function yolo2() {}")
+    not_awaitable = ne.eval("yolo2")
+
+    with raises(NodeEdgeValueError):
+        ne.await_many([promise, not_awaitable])
+
+    # The valid promise was not registered before the failure
+    assert not ne._pending
@@ -0,0 +1,77 @@
+from pytest import raises
+
+from node_edge.exceptions import *
+
+
+def test_batch(shared_engine):
+    ne = shared_engine
+    arr = ne.eval("['a']")
+
+    with ne.batch():
+        arr.append("b")
+        arr.append("c")
+        arr[0] = "z"
+
+    assert list(arr) == ["z", "b", "c"]
+
+
+def test_batch_flushes_on_read(shared_engine):
+    ne = shared_engine
+    arr = ne.eval("['a']")
+
+    with ne.batch():
+        arr.append("b")
+        assert arr[1] == "b"
+        assert len(arr) == 2
+
+
+def test_batch_error(shared_engine):
+    ne = shared_engine
+    ne.eval(
+        """
+        const batchTrap = new Proxy({f() {}}, {
+            set() { throw new Error('nope'); }
+        })
+        """
+    )
+    trap = ne.eval("batchTrap")
+
+    with raises(JavaScriptError):
+        with ne.batch():
+            trap.foo = 42
+
+
+def test_batch_error_on_read(shared_engine):
+    ne = shared_engine
+    ne.eval(
+        """
+        const readTrap = new Proxy({f() { return 42; }}, {
+            set() { throw new Error('nope'); }
+        })
+        """
+    )
+    trap = ne.eval("readTrap")
+
+    with raises(JavaScriptError):
+        with ne.batch():
+            trap.foo = 42
+            # Reads flush the batch first; the failing set must not leave
+            # the read's own entry dangling in the pending table
+            trap.f()
+
+    assert not ne._pending
+
+
+def test_batch_body_raises(shared_engine):
+    ne = shared_engine
+    arr = ne.eval("['a']")
+
+    with raises(ValueError):
+        with ne.batch():
+            arr.append("b")
+            raise ValueError("boom")
+
+    # The buffered append was flushed anyway (it already reported success)
+    # and nothing was left dangling in the pending table
+    assert list(arr) == ["a", "b"]
+    assert not ne._pending
@@ -2,86 +2,87 @@ import re
 
 from _pytest.python_api import raises
 
-from node_edge import JavaScriptError, NodeEdgeTypeError, NodeEngine
+from node_edge import JavaScriptError, NodeEdgeTypeError
 
 
-def test_call():
-    with NodeEngine({}) as ne:
-        ne.eval(
-            """
-            function doSomething(cbList) {
-                let out = 0;
+def test_call(shared_engine):
+    ne = shared_engine
+    eval_ = ne.eval
+    eval_(
+        """
+        function doSomething(cbList) {
+            let out = 0;
 
-                for (cb of cbList) {
-                    if (typeof cb === "function") {
-                        out += cb();
-                    } else {
-                        out += cb;
-                    }
+            for (cb of cbList) {
+                if (typeof cb === "function") {
+                    out += cb();
+                } else {
+                    out += cb;
                 }
-
-                return out;
             }
 
-            function doSomethingElse(cbMap) {
-                let out = 0;
+            return out;
+        }
 
-                for (const [key, cb] of Object.entries(cbMap)) {
-                    if (typeof cb === "function") {
-                        out += cb();
-                    } else {
-                        out += cb;
-                    }
-                }
+        function doSomethingElse(cbMap) {
+            let out = 0;
 
-                return out;
+            for (const [key, cb] of Object.entries(cbMap)) {
+                if (typeof cb === "function") {
+                    out += cb();
+                } else {
+                    out += cb;
+                }
             }
 
-            function return42() {
-                return 42;
-            }
+            return out;
+        }
 
-            function fail() {
-                throw new Error("fail");
-            }
-            """
-        )
+        function return42() {
+            return 42;
+        }
 
-        do_something = ne.eval("doSomething")
-        do_something_else = ne.eval("doSomethingElse")
-        return42 = ne.eval("return42")
-        fail = ne.eval("fail")
+        function fail() {
+            throw new Error("fail");
+        }
+        """
+    )
 
-        assert do_something([1, 2, 3, 4, 5]) == 15
-        assert do_something([1, 2, 3, 4, return42]) == 52
-        assert (
-            do_something_else(
-                {
-                    "foo": 1,
-                    "bar": 2,
-                    "baz": 3,
-                    "qux": 4,
-                }
-            )
-            == 10
+    do_something = eval_("doSomething")
+    do_something_else = eval_("doSomethingElse")
+    return42 = eval_("return42")
+    fail = eval_("fail")
+
+    assert do_something([1, 2, 3, 4, 5]) == 15
+    assert do_something([1, 2, 3, 4, return42]) == 52
+    assert (
+        do_something_else(
+            {
+                "foo": 1,
+                "bar": 2,
+                "baz": 3,
+                "qux": 4,
+            }
         )
-        assert (
-            do_something_else(
-                {
-                    "foo": 1,
-                    "bar": 2,
-                    "baz": 3,
-                    "qux": return42.__dict__["__pointer__"],
-                }
-            )
-            == 48
+        == 10
+    )
+    assert (
+        do_something_else(
+            {
+                "foo": 1,
+                "bar": 2,
+                "baz": 3,
+                "qux": return42.__pointer__,
+            }
         )
+        == 48
+    )
 
-        with raises(NodeEdgeTypeError):
-            do_something(object())
+    with raises(NodeEdgeTypeError):
+        do_something(object())
 
-        with raises(
-            JavaScriptError,
-            match=re.compile(r"^fail:\nError: fail\n {4}at fail \(evalmachine.*"),
-        ):
-            fail()
+    with raises(
+        JavaScriptError,
+        match=re.compile(r"^fail:\nError: fail\n {4}at fail \(evalmachine.*"),
+    ):
+        fail()
@@ -0,0 +1,20 @@
+from pytest import raises
+
+from node_edge.exceptions import *
+
+
+def test_expr(shared_engine):
+    ne = shared_engine
+    assert ne.expr("1 + $x", x=41) == 42
+
+    ne.eval("const exprObj = {baz() { return 42; }, arr: [() => 1]}")
+    obj = ne.eval("exprObj")
+    assert ne.expr("$obj.baz()", obj=obj) == 42
+    assert ne.expr("$obj.arr[0]() + $y", obj=obj, y=1) == 2
+
+    with raises(JavaScriptError):
+        ne.expr("$obj.nope()", obj=obj)
+
+    # Bindings don't leak into the context
+    with raises(JavaScriptError):
+        ne.eval("$obj")
@@ -9,47 +9,53 @@ from node_edge import *
 from node_edge.exceptions import *
 
 
-def test_gc():
-    with NodeEngine({}) as ne:
-        ne.eval(
-            """
-            class Foo {
-                constructor(val) {
-                    this.val = val;
-                }
-
-                getVal() {
-                    return this.val;
-                }
+def test_gc(shared_engine):
+    ne = shared_engine
+    ne.eval(
+        """
+        class Foo {
+            constructor(val) {
+                this.val = val;
             }
-            """
-        )
 
-        foo = ne.eval("new Foo(() => 42)")
-        r1 = ref(foo)
-        r2 = ref(foo.__dict__["__pointer__"])
-        assert foo.getVal()() == 42
+            getVal() {
+                return this.val;
+            }
+        }
+        """
+    )
+
+    foo = ne.eval("new Foo(() => 42)")
+    r1 = ref(foo)
+    r2 = ref(foo.__pointer__)
+    assert foo.getVal()() == 42
+
+    pointer_id = foo.__pointer__.id
+
+    bar = object()
+    assert sys.getrefcount(foo) == sys.getrefcount(bar)
 
-        pointer_id = foo.__dict__["__pointer__"].id
+    assert r1() is not None
+    assert r2() is not None
 
-        bar = object()
-        assert sys.getrefcount(foo) == sys.getrefcount(bar)
+    del foo
 
-        assert r1() is not None
-        assert r2() is not None
+    sleep(0.1)
+    gc.collect()
+    sleep(0.1)
 
-        del foo
+    assert r1() is None
+    assert r2() is None
 
-        sleep(0.1)
-        gc.collect()
-        sleep(0.1)
+    new_foo = JavaScriptProxy(JavaScriptPointer(pointer_id, False, False, "fake", ne))
 
-        assert r1() is None
-        assert r2() is None
+    with raises(JavaScriptError):
+        new_foo.getVal()()
 
-        new_foo = JavaScriptProxy(
-            JavaScriptPointer(pointer_id, False, False, "fake", ne)
-        )
 
-        with raises(JavaScriptError):
-            new_foo.getVal()()
+def test_pointer_interning(shared_engine):
+    ne = shared_engine
+    ne.eval("const internMe = {f() { return 1; }}")
+    a = ne.eval("internMe")
+    b = ne.eval("internMe")
+    assert a.__pointer__ is b.__pointer__
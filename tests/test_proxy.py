@@ -4,108 +4,137 @@ from node_edge import (
     JavaScriptArrayProxy,
     JavaScriptMappingProxy,
     JavaScriptProxy,
-    NodeEngine,
     as_mapping,
 )
 from node_edge.exceptions import *
 
 
-def test_array_proxy():
-    with NodeEngine({}) as ne:
-        arr = ne.eval("[() => 42, 'a']")
-        assert isinstance(arr, JavaScriptArrayProxy)
-        assert repr(arr) == "<JavaScriptArrayProxy [ [Function (anonymous)], 'a' ]>"
-        assert arr[0]() == 42
-        assert arr[1] == "a"
-        assert len(arr) == 2
+def test_array_proxy(shared_engine):
+    ne = shared_engine
+    arr = ne.eval("[() => 42, 'a']")
+    assert isinstance(arr, JavaScriptArrayProxy)
+    assert repr(arr) == "<JavaScriptArrayProxy [ [Function (anonymous)], 'a' ]>"
+    assert arr[0]() == 42
+    assert arr[1] == "a"
+    assert len(arr) == 2
 
-        arr.append("b")
-        assert arr[2] == "b"
-        assert len(arr) == 3
+    arr.append("b")
+    assert arr[2] == "b"
+    assert len(arr) == 3
 
-        arr[2] = "c"
-        assert arr[2] == "c"
+    arr[2] = "c"
+    assert arr[2] == "c"
 
-        del arr[2]
-        assert len(arr) == 2
+    del arr[2]
+    assert len(arr) == 2
 
-        with raises(IndexError):
-            # noinspection PyStatementEffect
-            arr[2]
+    with raises(IndexError):
+        # noinspection PyStatementEffect
+        arr[2]
 
 
-def test_mapping_proxy():
-    with NodeEngine({}) as ne:
-        ne.eval("const testRepr = {baz() { return 42; }}")
-        test_repr = as_mapping(ne.eval("testRepr"))
-        assert repr(test_repr) == "<JavaScriptMappingProxy { baz: [Function: baz] }>"
+def test_mapping_proxy(shared_engine):
+    eval_ = shared_engine.eval
+    eval_("const mappingRepr = {baz() { return 42; }}")
+    test_repr = as_mapping(eval_("mappingRepr"))
+    assert repr(test_repr) == "<JavaScriptMappingProxy { baz: [Function: baz] }>"
 
-        ne.eval('const mapping = {foo: 42, bar: "a", baz() { return 42; }}')
-        mapping = as_mapping(ne.eval("mapping"))
-        assert isinstance(mapping, JavaScriptMappingProxy)
-        assert mapping["foo"] == 42
-        assert mapping["bar"] == "a"
-        assert mapping["baz"]() == 42
-        assert len(mapping) == 3
-        assert list(mapping.keys()) == ["foo", "bar", "baz"]
+    eval_('const mapping = {foo: 42, bar: "a", baz() { return 42; }}')
+    mapping = as_mapping(eval_("mapping"))
+    assert isinstance(mapping, JavaScriptMappingProxy)
+    assert mapping["foo"] == 42
+    assert mapping["bar"] == "a"
+    assert mapping["baz"]() == 42
+    assert len(mapping) == 3
+    assert list(mapping.keys()) == ["foo", "bar", "baz"]
 
-        mapping["foo"] = 43
-        assert mapping["foo"] == 43
+    mapping["foo"] = 43
+    assert mapping["foo"] == 43
 
-        del mapping["foo"]
-        assert len(mapping) == 2
+    del mapping["foo"]
+    assert len(mapping) == 2
 
-        with raises(KeyError):
-            # noinspection PyStatementEffect
-            mapping["foo"]
+    with raises(KeyError):
+        # noinspection PyStatementEffect
+        mapping["foo"]
 
 
-def test_object_proxy():
-    with NodeEngine({}) as ne:
-        ne.eval("const testRepr = {baz() { return 42; }}")
-        test_repr = ne.eval("testRepr")
-        assert repr(test_repr) == "<JavaScriptProxy { baz: [Function: baz] }>"
+def test_object_proxy(shared_engine):
+    eval_ = shared_engine.eval
+    eval_("const objRepr = {baz() { return 42; }}")
+    test_repr = eval_("objRepr")
+    assert repr(test_repr) == "<JavaScriptProxy { baz: [Function: baz] }>"
 
-        ne.eval('const obj = {foo: 42, bar: "a", baz() { return 42; }}')
-        obj = ne.eval("obj")
-        assert isinstance(obj, JavaScriptProxy)
-        assert obj.foo == 42
-        assert obj["foo"] == 42
-        assert obj.bar == "a"
-        assert obj.baz() == 42
+    eval_('const obj = {foo: 42, bar: "a", baz() { return 42; }}')
+    obj = eval_("obj")
+    assert isinstance(obj, JavaScriptProxy)
+    assert obj.foo == 42
+    assert obj["foo"] == 42
+    assert obj.bar == "a"
+    assert obj.baz() == 42
 
-        obj.foo = 43
-        assert obj.foo == 43
+    obj.foo = 43
+    assert obj.foo == 43
 
-        del obj.foo
+    del obj.foo
 
-        with raises(AttributeError):
-            # noinspection PyStatementEffect
-            obj.foo
+    with raises(AttributeError):
+        # noinspection PyStatementEffect
+        obj.foo
 
-        with raises(KeyError):
-            # noinspection PyStatementEffect
-            obj["foo"]
+    with raises(KeyError):
+        # noinspection PyStatementEffect
+        obj["foo"]
 
 
-def test_as_mapping():
-    with NodeEngine({}) as ne:
-        ne.eval('const obj = {foo: 42, bar: "a", baz() { return 42; }}')
-        obj = ne.eval("obj")
-        assert isinstance(obj, JavaScriptProxy)
-        assert isinstance(as_mapping(obj), JavaScriptMappingProxy)
-        assert isinstance(
-            as_mapping(obj.__dict__["__pointer__"]), JavaScriptMappingProxy
-        )
+def test_as_mapping(shared_engine):
+    ne = shared_engine
+    ne.eval('const mapObj = {foo: 42, bar: "a", baz() { return 42; }}')
+    obj = ne.eval("mapObj")
+    assert isinstance(obj, JavaScriptProxy)
+    assert isinstance(as_mapping(obj), JavaScriptMappingProxy)
+    assert isinstance(as_mapping(obj.__pointer__), JavaScriptMappingProxy)
 
-        with raises(NodeEdgeTypeError):
-            as_mapping("foo")  # noqa
+    with raises(NodeEdgeTypeError):
+        as_mapping("foo")  # noqa
 
 
-def test_get_pointer():
-    with NodeEngine({}) as ne:
-        promise = ne.eval("new Promise((resolve) => resolve(42))")
-        assert ne.await_(promise.__dict__["__pointer__"]) == 42
+def test_get_pointer(shared_engine):
+    ne = shared_engine
+    promise = ne.eval("new Promise((resolve) => resolve(42))")
+    assert ne.await_(promise.__pointer__) == 42
 
-        with raises(NodeEdgeTypeError):
-            ne.await_("foo")  # noqa
+    with raises(NodeEdgeTypeError):
+        ne.await_("foo")  # noqa
+
+
+def test_array_alias_len(shared_engine):
+    """
+    Pointers are interned, so two eval() of the same array give two proxies
+    over one pointer. The length cache lives on the pointer, so mutating
+    through one alias must be visible through the other.
+    """
+
+    ne = shared_engine
+    ne.eval("const aliasArr = [() => 42, 'b']")
+    a = ne.eval("aliasArr")
+    b = ne.eval("aliasArr")
+    assert a.__pointer__ is b.__pointer__
+    assert len(a) == 2
+
+    b.append("c")
+    a.append("d")
+
+    assert list(a)[1:] == ["b", "c", "d"]
+    assert len(a) == 4
+    assert len(b) == 4
+
+
+def test_array_iter(shared_engine):
+    ne = shared_engine
+    assert list(ne.eval("[1, 'a', [2]]")) == [1, "a", [2]]
+
+    mixed = ne.eval("[() => 42, 'b']")
+    got = list(mixed)
+    assert got[0]() == 42
+    assert got[1] == "b"
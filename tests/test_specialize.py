@@ -0,0 +1,25 @@
+from pytest import raises
+
+from node_edge import JavaScriptProxy
+from node_edge.exceptions import *
+
+
+def test_specialize(shared_engine):
+    ne = shared_engine
+    ne.eval("const shapeObj = {foo: 42, baz() { return 42; }}")
+    obj = ne.specialize(ne.eval("shapeObj"))
+
+    assert isinstance(obj, JavaScriptProxy)
+    assert "foo" in type(obj).__dict__
+    assert obj.foo == 42
+    assert obj.baz() == 42
+
+    obj.foo = 43
+    assert obj.foo == 43
+
+    # Same shape, same generated class
+    other = ne.specialize(ne.eval("shapeObj"))
+    assert type(other) is type(obj)
+
+    with raises(NodeEdgeTypeError):
+        ne.specialize("foo")  # noqa